@@ -23,9 +23,119 @@ ALADDIN_ACCURACY = 70  # in your metric, please set the accuracy you think Aladd
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-import csv, os, sys, math
+import csv, os, math, functools
 from copy import deepcopy
-from accelergy.helper_functions import oneD_linear_interpolation, oneD_quadratic_interpolation
+
+# the 40nm Aladdin data is also used for 45nm designs
+_SUPPORTED_TECHNOLOGIES = frozenset([40, '40', '40nm', 45, '45', '45nm'])
+
+_THIS_DIR = os.path.dirname(os.path.abspath(__file__))
+_CSV_PATHS = {name: os.path.join(_THIS_DIR, 'data', name + '.csv')
+              for name in ['reg', 'comparator', 'crossbar', 'counter', 'bitwise', 'adder', 'multiplier',
+                           'fp_sp_adder', 'fp_dp_adder', 'fp_sp_multiplier', 'fp_dp_multiplier']}
+
+_IDLE, _DYNAMIC, _AREA = 0, 1, 2
+
+def _load_tables():
+    # parse every Aladdin table in a single pass,
+    # returns {csv_file_path: {latency: (idle energy, dynamic energy, area)}}
+    tables = {}
+    for csv_file_path in _CSV_PATHS.values():
+        with open(csv_file_path) as csv_file:
+            reader = csv.reader(csv_file)
+            header = next(reader)
+            latency_idx = header.index('latency(ns)')
+            idle_idx = header.index('idle energy(pJ)')
+            dynamic_idx = header.index('dynamic energy(pJ)')
+            area_idx = header.index('area(um^2)')
+            tables[csv_file_path] = {float(row[latency_idx]): (float(row[idle_idx]),
+                                                              float(row[dynamic_idx]),
+                                                              float(row[area_idx]))
+                                     for row in reader if row}
+    return tables
+
+# the tables are small, so they are all loaded when the plug-in module is imported
+_TABLES = _load_tables()
+
+# table row used for a (rounded up) latency of 0, 1, ..., 10 and above 10 ns
+_TABLE_LATENCIES = (0, 1, 2, 3, 4, 5, 6, 6, 6, 6, 6, 10)
+
+def _table_latency(latency):
+    # convert a latency attribute to the nanosecond value of an existing table row
+    # (rounding up, can perform linear interpolation as well)
+    if isinstance(latency, str) and 'ns' in latency:
+        latency = math.ceil(float(latency.split('ns')[0]))
+    elif isinstance(latency, str) and 'ps' in latency:
+        latency = math.ceil(float(latency.split('ps')[0])/1000)
+    else:
+        latency = math.ceil(latency)
+    return _TABLE_LATENCIES[max(0, min(latency, 11))]
+
+def _table_energy(csv_file_path, latency, action_name):
+    # there are only two types of energy in Aladdin tables
+    return _TABLES[csv_file_path][latency][_IDLE if action_name == 'idle' else _DYNAMIC]
+
+# energy/area scale linearly (adders) or quadratically (multipliers) with the bitwidth,
+# anchored at (0, 0) and at the bitwidth characterized in the csv table
+def _lin(nbit, value, csv_nbit=32):
+    return value * nbit / csv_nbit
+
+def _quad(nbit, value, csv_nbit=32):
+    return value * (nbit * nbit) / (csv_nbit * csv_nbit)
+
+def _energies_by_latency(csv_file_path):
+    # {latency: idle energy} and {latency: dynamic energy} of a table
+    table = _TABLES[csv_file_path]
+    return ({latency: row[_IDLE] for latency, row in table.items()},
+            {latency: row[_DYNAMIC] for latency, row in table.items()})
+
+def _make_adder_estimator(csv_file_path, csv_nbit):
+    # specialize an adder energy estimation to its table
+    idle, dynamic = _energies_by_latency(csv_file_path)
+    def estimate(latency, action_name, nbit):
+        return _lin(nbit, (idle if action_name == 'idle' else dynamic)[latency], csv_nbit)
+    return estimate
+
+def _make_multiplier_estimator(csv_file_path, csv_nbit):
+    # specialize a multiplier energy estimation to its table
+    idle, dynamic = _energies_by_latency(csv_file_path)
+    def estimate(latency, action_name, nbit):
+        # a gated multiplier consumes idle energy, a reused multiplier 85% of the dynamic energy
+        if action_name == 'idle' or action_name == 'mult_gated':
+            return _quad(nbit, idle[latency], csv_nbit)
+        energy = _quad(nbit, dynamic[latency], csv_nbit)
+        return 0.85 * energy if action_name == 'mult_reused' else energy
+    return estimate
+
+_intadder_energy = _make_adder_estimator(_CSV_PATHS['adder'], 32)
+_fp_sp_adder_energy = _make_adder_estimator(_CSV_PATHS['fp_sp_adder'], 32)
+_fp_dp_adder_energy = _make_adder_estimator(_CSV_PATHS['fp_dp_adder'], 64)
+_intmultiplier_energy = _make_multiplier_estimator(_CSV_PATHS['multiplier'], 32)
+_fp_sp_multiplier_energy = _make_multiplier_estimator(_CSV_PATHS['fp_sp_multiplier'], 32)
+_fp_dp_multiplier_energy = _make_multiplier_estimator(_CSV_PATHS['fp_dp_multiplier'], 64)
+
+# action of the multiplier inside a mac, all other mac actions map to 'mult_random'
+_MAC_MULTIPLIER_ACTIONS = {'mac_gated': 'mult_gated', 'mac_reused': 'mult_reused', 'idle': 'idle'}
+
+def _mac_energy(adder_energy, multiplier_energy, latency, action_name, nbit):
+    multiplier_action = _MAC_MULTIPLIER_ACTIONS.get(action_name, 'mult_random')
+    return adder_energy(latency, action_name, nbit) + multiplier_energy(latency, multiplier_action, nbit)
+
+def _freeze(mapping):
+    # hashable view of the attributes/arguments dictionary, used as a memoization key
+    return None if mapping is None else tuple(sorted(mapping.items()))
+
+def _energy_key(interface):
+    # memoization key of an energy query, None if the query has unhashable attribute or argument values
+    # a plain tuple on purpose: the key is built for every query, and a NamedTuple (pure Python
+    # constructor) view of it makes cache hits slower without saving any lookup
+    key = (interface['class_name'], _freeze(interface['attributes']),
+           interface['action_name'], _freeze(interface['arguments']))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
 
 class AladdinTable(AccelergyPlugIn):
     # -------------------------------------------------------------------------------------
@@ -33,14 +143,28 @@ class AladdinTable(AccelergyPlugIn):
     # -------------------------------------------------------------------------------------
     def __init__(self):
         # example primitive classes supported by this estimator
-        self.supported_pc = ['regfile', 'SRAM', 'counter', 'comparator', 'crossbar', 'wire', 'FIFO',
-                             'bitwise', 'intadder', 'intmultiplier', 'intmac',
-                             'fpadder', 'fpmultiplier', 'fpmac', 'reg']
+        self.supported_pc = frozenset(['regfile', 'SRAM', 'counter', 'comparator', 'crossbar', 'wire',
+                                       'FIFO', 'bitwise', 'intadder', 'intmultiplier', 'intmac',
+                                       'fpadder', 'fpmultiplier', 'fpmac', 'reg'])
         self.aladdin_area_query_plug_ins = AladdinAreaQueires(self.supported_pc)
+        # primitive class name -> bound energy estimation function
+        self._dispatch = {class_name: getattr(self, class_name + '_estimate_energy')
+                          for class_name in self.supported_pc}
+        # identical (class, attributes, action, arguments) queries are answered from the cache
+        self._cached_estimate_energy = functools.lru_cache(maxsize=4096)(self._estimate_energy_from_key)
 
     def get_name(self) -> str:
         return 'Aladdin_table'
 
+    # the support checks run for every primitive, a missing technology is only reported once per process
+    _warned_missing_technology = False
+
+    def _warn_missing_technology(self):
+        if not AladdinTable._warned_missing_technology:
+            AladdinTable._warned_missing_technology = True
+            self.logger.warning('No technology specified in the request, '
+                                'Aladdin estimations are not used')
+
     def primitive_action_supported(self, query: AccelergyQuery) -> AccuracyEstimation:
         class_name = query.class_name
         attributes = query.class_attrs
@@ -49,11 +173,11 @@ class AladdinTable(AccelergyPlugIn):
         # Legacy interface dictionary has keys class_name, attributes, action_name, and arguments
         interface = query.to_legacy_interface_dict()
 
-        assert 'technology' in attributes, 'No technology specified in the request.'
+        if 'technology' not in attributes:
+            self._warn_missing_technology()
+            return AccuracyEstimation(0)
         technology = attributes['technology']
-        if (technology == 40  or technology == '40' or technology == '40nm' or
-            technology == 45  or technology == '45' or technology == '45nm') \
-                and class_name in self.supported_pc:
+        if technology in _SUPPORTED_TECHNOLOGIES and class_name in self.supported_pc:
             if (class_name == "SRAM"):
                 width = attributes['width']
                 depth = attributes['depth']
@@ -66,13 +190,15 @@ class AladdinTable(AccelergyPlugIn):
 
 
     def estimate_energy(self, query: AccelergyQuery) -> Estimation:
-        class_name = query.class_name
         # Legacy interface dictionary has keys class_name, attributes, action_name, and arguments
         interface = query.to_legacy_interface_dict()
+        return Estimation(self._interface_energy(interface), 'p') # energy is in pJ
 
-        query_function_name = class_name + '_estimate_energy'
-        energy = getattr(self, query_function_name)(interface)
-        return Estimation(energy, 'p') # energy is in pJ
+    def estimate_energy_batch(self, queries) -> list:
+        # not part of the plug-in interface: estimates a list of independent queries in one call,
+        # repeated queries are answered by the memoized estimation
+        interface_energy = self._interface_energy
+        return [Estimation(interface_energy(query.to_legacy_interface_dict()), 'p') for query in queries]
 
     def primitive_area_supported(self, query: AccelergyQuery) -> AccuracyEstimation:
         class_name = query.class_name
@@ -80,12 +206,12 @@ class AladdinTable(AccelergyPlugIn):
         interface = query.to_legacy_interface_dict()
 
 
-        assert 'technology' in interface['attributes'], 'No technology specified in the request.'
+        if 'technology' not in interface['attributes']:
+            self._warn_missing_technology()
+            return AccuracyEstimation(0)
         class_name = interface['class_name']
         technology = interface['attributes']['technology']
-        if (technology == 40  or technology == '40' or technology == '40nm' or
-            technology == 45  or technology == '45' or technology == '45nm') \
-                and class_name in self.supported_pc:
+        if technology in _SUPPORTED_TECHNOLOGIES and class_name in self.supported_pc:
 
             # small SRAM can be approximated as regfile
             if (class_name == "SRAM"):
@@ -108,30 +234,25 @@ class AladdinTable(AccelergyPlugIn):
     # ============================================================
     # User's functions, purely user-defined
     # ============================================================
+    def _interface_energy(self, interface):
+        key = _energy_key(interface)
+        if key is None:
+            return self._dispatch[interface['class_name']](interface)
+        return self._cached_estimate_energy(*key)
+
+    def _estimate_energy_from_key(self, class_name, attributes, action_name, arguments):
+        # rebuild a fresh interface so that the estimation functions can modify it freely
+        interface = {'class_name': class_name,
+                     'attributes': dict(attributes),
+                     'action_name': action_name,
+                     'arguments': None if arguments is None else dict(arguments)}
+        return self._dispatch[class_name](interface)
+
     @staticmethod
     def query_csv_using_latency(interface, csv_file_path):
-        # default latency for Aladdin estimation is 
-        latency = interface['attributes']['latency'] if 'latency' in interface['attributes'] else 5
-        # round to an existing latency (can perform linear interpolation as well)
-        if isinstance(latency, str) and 'ns' in latency:
-            latency = math.ceil(float(latency.split('ns')[0]))
-        elif isinstance(latency, str) and 'ps' in latency:
-            latency = math.ceil(float(latency.split('ps')[0])/1000)
-        else:
-            latency = math.ceil(latency)
-        if latency > 10:
-            latency = 10
-        elif latency > 6:
-            latency = 6
-        # there are only two types of energy in Aladdin tables
-        action_name = 'idle energy(pJ)' if interface['action_name'] == 'idle' else 'dynamic energy(pJ)'
-        with open(csv_file_path) as csv_file:
-            reader = csv.DictReader(csv_file)
-            for row in reader:
-                if row['latency(ns)'] == str(latency):
-                    energy = float(row[action_name])
-                    break
-        return energy
+        # default latency for Aladdin estimation is 5ns
+        latency = _table_latency(interface['attributes'].get('latency', 5))
+        return _table_energy(csv_file_path, latency, interface['action_name'])
 
 
     def SRAM_estimate_energy(self, interface):
@@ -140,8 +261,7 @@ class AladdinTable(AccelergyPlugIn):
     def regfile_estimate_energy(self, interface):
         width = interface['attributes']['width']
         depth = interface['attributes']['depth']
-        this_dir, this_filename = os.path.split(__file__)
-        csv_file_path = os.path.join(this_dir, 'data/reg.csv')
+        csv_file_path = _CSV_PATHS['reg']
         if depth == 0:
             return 0
         action_name = interface['action_name']
@@ -180,8 +300,7 @@ class AladdinTable(AccelergyPlugIn):
         return reg_file_energy
 
     def reg_estimate_energy(self, interface):
-        this_dir, this_filename = os.path.split(__file__)
-        csv_file_path = os.path.join(this_dir, 'data/reg.csv')
+        csv_file_path = _CSV_PATHS['reg']
         reg_interface = deepcopy(interface)
         reg_energy = AladdinTable.query_csv_using_latency(reg_interface, csv_file_path)
         return reg_energy
@@ -191,8 +310,7 @@ class AladdinTable(AccelergyPlugIn):
         depth = interface['attributes']['depth']
         if depth == 0:
             return 0
-        this_dir, this_filename = os.path.split(__file__)
-        csv_file_path = os.path.join(this_dir, 'data/reg.csv')
+        csv_file_path = _CSV_PATHS['reg']
         reg_energy = AladdinTable.query_csv_using_latency(interface, csv_file_path)
 
         if interface['action_name'] == 'idle':
@@ -211,18 +329,16 @@ class AladdinTable(AccelergyPlugIn):
         n_inputs = interface['attributes']['n_inputs']
         n_outputs = interface['attributes']['n_outputs']
         datawidth = interface['attributes']['datawidth']
-        this_dir, this_filename = os.path.split(__file__)
-        csv_file_path = os.path.join(this_dir, 'data/crossbar.csv')
+        csv_file_path = _CSV_PATHS['crossbar']
         csv_energy = AladdinTable.query_csv_using_latency(interface, csv_file_path)
-        crossbar_energy = csv_energy * n_inputs * (n_outputs/4) * (datawidth/32)
+        crossbar_energy = _lin(datawidth, csv_energy * n_inputs * (n_outputs/4))
         return crossbar_energy
 
     def counter_estimate_energy(self, interface):
         width = interface['attributes']['width']
-        this_dir, this_filename = os.path.split(__file__)
-        csv_file_path = os.path.join(this_dir, 'data/counter.csv')
+        csv_file_path = _CSV_PATHS['counter']
         csv_energy = AladdinTable.query_csv_using_latency(interface, csv_file_path)
-        energy = csv_energy * (width/32)
+        energy = _lin(width, csv_energy)
         return energy
 
     def wire_estimate_energy(self, interface):
@@ -256,110 +372,54 @@ class AladdinTable(AccelergyPlugIn):
 
     def comparator_estimate_energy(self, interface):
         datawidth = interface['attributes']['datawidth']
-        this_dir, this_filename = os.path.split(__file__)
-        csv_file_path = os.path.join(this_dir, 'data/comparator.csv')
+        csv_file_path = _CSV_PATHS['comparator']
         csv_energy = AladdinTable.query_csv_using_latency(interface, csv_file_path)
-        energy = csv_energy * (datawidth/32)
+        energy = _lin(datawidth, csv_energy)
         return energy
 
     def intmac_estimate_energy(self, interface):
         # mac is naively modeled as adder and multiplier
-        multiplier_interface = deepcopy(interface)
-        if interface['action_name'] == 'mac_gated':
-            multiplier_interface['action_name'] = 'mult_gated'
-        elif interface['action_name'] == 'mac_reused':
-            multiplier_interface['action_name'] = 'mult_reused'
-        elif interface['action_name'] == 'idle':
-            multiplier_interface['action_name'] = 'idle'
-        else:
-            multiplier_interface['action_name'] = 'mult_random'
-        adder_energy = self.intadder_estimate_energy(interface)
-        multiplier_energy = self.intmultiplier_estimate_energy(multiplier_interface)
-        energy = adder_energy + multiplier_energy
-        return energy
+        nbit = interface['attributes']['datawidth']
+        latency = _table_latency(interface['attributes'].get('latency', 5))
+        return _mac_energy(_intadder_energy, _intmultiplier_energy,
+                           latency, interface['action_name'], nbit)
 
     def fpmac_estimate_energy(self, interface):
         # fpmac is naively modeled as fpadder and fpmultiplier
-        multiplier_interface = deepcopy(interface)
-        if interface['action_name'] == 'mac_gated':
-            multiplier_interface['action_name'] = 'mult_gated'
-        elif interface['action_name'] == 'mac_reused':
-            multiplier_interface['action_name'] = 'mult_reused'
-        elif interface['action_name'] == 'idle':
-            multiplier_interface['action_name'] = 'idle'
-        else:
-            multiplier_interface['action_name'] = 'mult_random'
-        fpadder_energy = self.fpadder_estimate_energy(interface)
-        fpmultiplier_energy = self.fpmultiplier_estimate_energy(interface)
-        energy = fpadder_energy + fpmultiplier_energy
-        return energy
+        nbit = interface['attributes']['exponent'] + interface['attributes']['mantissa']
+        latency = _table_latency(interface['attributes'].get('latency', 5))
+        if nbit <= 32:
+            return _mac_energy(_fp_sp_adder_energy, _fp_sp_multiplier_energy,
+                               latency, interface['action_name'], nbit)
+        return _mac_energy(_fp_dp_adder_energy, _fp_dp_multiplier_energy,
+                           latency, interface['action_name'], nbit)
 
     def intadder_estimate_energy(self, interface):
-        this_dir, this_filename = os.path.split(__file__)
         nbit = interface['attributes']['datawidth']
-        csv_nbit = 32
-        csv_file_path = os.path.join(this_dir, 'data/adder.csv')
-        energy = AladdinTable.query_csv_using_latency(interface, csv_file_path)
-        if not nbit == csv_nbit:
-            energy = oneD_linear_interpolation(nbit, [{'x': 0, 'y': 0}, {'x': csv_nbit, 'y': energy}])
-        return energy
+        latency = _table_latency(interface['attributes'].get('latency', 5))
+        return _intadder_energy(latency, interface['action_name'], nbit)
 
     def fpadder_estimate_energy(self, interface):
-        this_dir, this_filename = os.path.split(__file__)
-        nbit_exponent = interface['attributes']['exponent']
-        nbit_mantissa = interface['attributes']['mantissa']
-        nbit = nbit_mantissa + nbit_exponent
-        if nbit_exponent + nbit_mantissa <= 32:
-            csv_nbit = 32
-            csv_file_path = os.path.join(this_dir, 'data/fp_sp_adder.csv')
-        else:
-            csv_nbit = 64
-            csv_file_path = os.path.join(this_dir, 'data/fp_dp_adder.csv')
-        energy = AladdinTable.query_csv_using_latency(interface, csv_file_path)
-        if not nbit == csv_nbit:
-            energy = oneD_linear_interpolation(nbit, [{'x': 0, 'y': 0}, {'x': csv_nbit, 'y': energy}])
-        return energy
+        nbit = interface['attributes']['exponent'] + interface['attributes']['mantissa']
+        latency = _table_latency(interface['attributes'].get('latency', 5))
+        if nbit <= 32:
+            return _fp_sp_adder_energy(latency, interface['action_name'], nbit)
+        return _fp_dp_adder_energy(latency, interface['action_name'], nbit)
 
     def intmultiplier_estimate_energy(self, interface):
-        this_dir, this_filename = os.path.split(__file__)
         nbit = interface['attributes']['datawidth']
-        action_name = interface['action_name']
-        if action_name == 'mult_gated':
-            interface['action_name'] = 'idle'  # reflect gated multiplier energy
-        csv_nbit = 32
-        csv_file_path = os.path.join(this_dir, 'data/multiplier.csv')
-        energy = AladdinTable.query_csv_using_latency(interface, csv_file_path)
-
-        if not nbit == csv_nbit:
-            energy = oneD_quadratic_interpolation(nbit, [{'x': 0, 'y': 0}, {'x': csv_nbit, 'y': energy}])
-        if action_name == 'mult_reused':
-            energy = 0.85 * energy
-        return energy
+        latency = _table_latency(interface['attributes'].get('latency', 5))
+        return _intmultiplier_energy(latency, interface['action_name'], nbit)
 
     def fpmultiplier_estimate_energy(self, interface):
-        this_dir, this_filename = os.path.split(__file__)
-        action_name = interface['action_name']
-        if action_name == 'mult_gated':
-            interface['action_name'] = 'idle'  # reflect gated multiplier energy
-        nbit_exponent = interface['attributes']['exponent']
-        nbit_mantissa = interface['attributes']['mantissa']
-        nbit = nbit_mantissa + nbit_exponent
-        if nbit_exponent + nbit_mantissa <= 32:
-            csv_nbit = 32
-            csv_file_path = os.path.join(this_dir, 'data/fp_sp_multiplier.csv')
-        else:
-            csv_nbit = 64
-            csv_file_path = os.path.join(this_dir, 'data/fp_dp_multiplier.csv')
-        energy = AladdinTable.query_csv_using_latency(interface, csv_file_path)
-        if not nbit == csv_nbit:
-            energy = oneD_quadratic_interpolation(nbit, [{'x': 0, 'y': 0}, {'x': csv_nbit, 'y': energy}])
-        if action_name == 'mult_reused':
-            energy = 0.85 * energy
-        return energy
+        nbit = interface['attributes']['exponent'] + interface['attributes']['mantissa']
+        latency = _table_latency(interface['attributes'].get('latency', 5))
+        if nbit <= 32:
+            return _fp_sp_multiplier_energy(latency, interface['action_name'], nbit)
+        return _fp_dp_multiplier_energy(latency, interface['action_name'], nbit)
 
     def bitwise_estimate_energy(self, interface):
-        this_dir, this_filename = os.path.split(__file__)
-        csv_file_path = os.path.join(this_dir, 'data/bitwise.csv')
+        csv_file_path = _CSV_PATHS['bitwise']
         csv_energy = AladdinTable.query_csv_using_latency(interface, csv_file_path)
         return csv_energy
 
@@ -368,41 +428,25 @@ class AladdinTable(AccelergyPlugIn):
 # ART-related functions
 #---------------------------------------------------------------------------
 class AladdinAreaQueires():
+    __slots__ = ('supported_pc', '_dispatch')
+
     def __init__(self, supported_pc):
         # example primitive classes supported by this estimator
         self.supported_pc = supported_pc
+        # primitive class name -> bound area estimation function
+        self._dispatch = {class_name: getattr(self, class_name + '_estimate_area')
+                          for class_name in supported_pc}
 
     def estimate_area(self, interface):
         class_name = interface['class_name']
-        query_function_name = class_name + '_estimate_area'
-        area = getattr(self, query_function_name)(interface)
+        area = self._dispatch[class_name](interface)
         return area
 
     @staticmethod
     def query_csv_area_using_latency(interface, csv_file_path):
-        # default latency for Aladdin estimation is 
-        if 'latency' in interface['attributes']:
-            latency = interface['attributes']['latency']
-        else:
-            latency = 5
-        # round to an exist
-        # ing latency (can perform linear interpolation as well)
-        if isinstance(latency, str) and 'ns' in latency:
-            latency = math.ceil(float(latency.split('ns')[0]))
-        else:
-            latency = math.ceil(latency)
-        if latency > 10:
-            latency = 10
-        elif latency > 6:
-            latency = 6
-        # there are only two types of energy in Aladdin tables
-        with open(csv_file_path) as csv_file:
-            reader = csv.DictReader(csv_file)
-            for row in reader:
-                if row['latency(ns)'] == str(latency):
-                    area = float(row['area(um^2)'])
-                    break
-        return area
+        # default latency for Aladdin estimation is 5ns
+        latency = _table_latency(interface['attributes'].get('latency', 5))
+        return _TABLES[csv_file_path][latency][_AREA]
 
 
     def SRAM_estimate_area(self, interface):
@@ -414,8 +458,7 @@ class AladdinAreaQueires():
 
         width = interface['attributes']['width']
         depth = interface['attributes']['depth']
-        this_dir, this_filename = os.path.split(__file__)
-        csv_file_path = os.path.join(this_dir, 'data/reg.csv')
+        csv_file_path = _CSV_PATHS['reg']
         if depth == 0:
             return 0
         reg_interface = deepcopy(interface)
@@ -427,9 +470,8 @@ class AladdinAreaQueires():
         return reg_file_area
 
     def reg_estimate_area(self, interface):
-        this_dir, this_filename = os.path.split(__file__)
         reg_interface = deepcopy(interface)
-        csv_file_path = os.path.join(this_dir, 'data/reg.csv')
+        csv_file_path = _CSV_PATHS['reg']
         reg_area = AladdinAreaQueires.query_csv_area_using_latency(reg_interface, csv_file_path)
         return reg_area
 
@@ -438,8 +480,7 @@ class AladdinAreaQueires():
         depth = interface['attributes']['depth']
         if depth == 0:
             return 0
-        this_dir, this_filename = os.path.split(__file__)
-        csv_file_path = os.path.join(this_dir, 'data/reg.csv')
+        csv_file_path = _CSV_PATHS['reg']
         reg_area = AladdinAreaQueires.query_csv_area_using_latency(interface, csv_file_path)
         comparator_interface = {'attributes': {'datawidth': math.log2(float(depth))}}
         comparator_area = self.comparator_estimate_area(comparator_interface)
@@ -451,26 +492,23 @@ class AladdinAreaQueires():
         n_inputs = interface['attributes']['n_inputs']
         n_outputs = interface['attributes']['n_outputs']
         datawidth = interface['attributes']['datawidth']
-        this_dir, this_filename = os.path.split(__file__)
-        csv_file_path = os.path.join(this_dir, 'data/crossbar.csv')
+        csv_file_path = _CSV_PATHS['crossbar']
         csv_area = AladdinAreaQueires.query_csv_area_using_latency(interface, csv_file_path)
-        crossbar_area = csv_area * n_inputs * (n_outputs/4) * (datawidth/32)
+        crossbar_area = _lin(datawidth, csv_area * n_inputs * (n_outputs/4))
         return crossbar_area
 
     def counter_estimate_area(self, interface):
         width = interface['attributes']['width']
-        this_dir, this_filename = os.path.split(__file__)
-        csv_file_path = os.path.join(this_dir, 'data/counter.csv')
+        csv_file_path = _CSV_PATHS['counter']
         csv_energy = AladdinAreaQueires.query_csv_area_using_latency(interface, csv_file_path)
-        energy = csv_energy * (width/32)
+        energy = _lin(width, csv_energy)
         return energy
 
     def comparator_estimate_area(self, interface):
         datawidth = interface['attributes']['datawidth']
-        this_dir, this_filename = os.path.split(__file__)
-        csv_file_path = os.path.join(this_dir, 'data/comparator.csv')
+        csv_file_path = _CSV_PATHS['comparator']
         csv_area = AladdinAreaQueires.query_csv_area_using_latency(interface, csv_file_path)
-        area = csv_area * (datawidth / 32)
+        area = _lin(datawidth, csv_area)
         return area
 
     def wire_estimate_area(self, interface):
@@ -492,81 +530,50 @@ class AladdinAreaQueires():
         return area
 
     def intadder_estimate_area(self, interface):
-        this_dir, this_filename = os.path.split(__file__)
         nbit = interface['attributes']['datawidth']
         csv_nbit = 32
-        csv_file_path = os.path.join(this_dir, 'data/adder.csv')
+        csv_file_path = _CSV_PATHS['adder']
         area = AladdinAreaQueires.query_csv_area_using_latency(interface, csv_file_path)
-        if not nbit == csv_nbit:
-            area = oneD_linear_interpolation(nbit, [{'x': 0, 'y': 0}, {'x': csv_nbit, 'y': area}])
+        area = _lin(nbit, area, csv_nbit)
         return area
 
     def fpadder_estimate_area(self, interface):
-        this_dir, this_filename = os.path.split(__file__)
         nbit_exponent = interface['attributes']['exponent']
         nbit_mantissa = interface['attributes']['mantissa']
         nbit = nbit_mantissa + nbit_exponent
         if nbit_exponent + nbit_mantissa <= 32:
             csv_nbit = 32
-            csv_file_path = os.path.join(this_dir, 'data/fp_sp_adder.csv')
+            csv_file_path = _CSV_PATHS['fp_sp_adder']
         else:
             csv_nbit = 64
-            csv_file_path = os.path.join(this_dir, 'data/fp_dp_adder.csv')
+            csv_file_path = _CSV_PATHS['fp_dp_adder']
         area = AladdinAreaQueires.query_csv_area_using_latency(interface, csv_file_path)
-        if not nbit == csv_nbit:
-            area = oneD_linear_interpolation(nbit, [{'x': 0, 'y': 0}, {'x': csv_nbit, 'y': area}])
+        area = _lin(nbit, area, csv_nbit)
         return area
 
     def intmultiplier_estimate_area(self, interface):
-        this_dir, this_filename = os.path.split(__file__)
         nbit = interface['attributes']['datawidth']
         csv_nbit = 32
-        csv_file_path = os.path.join(this_dir, 'data/multiplier.csv')
+        csv_file_path = _CSV_PATHS['multiplier']
         area = AladdinAreaQueires.query_csv_area_using_latency(interface, csv_file_path)
-        if not nbit == csv_nbit:
-            area = oneD_quadratic_interpolation(nbit, [{'x': 0, 'y': 0}, {'x': csv_nbit, 'y': area}])
+        area = _quad(nbit, area, csv_nbit)
         return area
 
     def fpmultiplier_estimate_area(self, interface):
-        this_dir, this_filename = os.path.split(__file__)
         nbit_exponent = interface['attributes']['exponent']
         nbit_mantissa = interface['attributes']['mantissa']
         nbit = nbit_mantissa + nbit_exponent
         if nbit_exponent + nbit_mantissa <= 32:
             csv_nbit = 32
-            csv_file_path = os.path.join(this_dir, 'data/fp_sp_multiplier.csv')
+            csv_file_path = _CSV_PATHS['fp_sp_multiplier']
         else:
             csv_nbit = 64
-            csv_file_path = os.path.join(this_dir, 'data/fp_dp_multiplier.csv')
+            csv_file_path = _CSV_PATHS['fp_dp_multiplier']
         area = AladdinAreaQueires.query_csv_area_using_latency(interface, csv_file_path)
-        if not nbit == csv_nbit:
-            area = oneD_quadratic_interpolation(nbit, [{'x': 0, 'y': 0}, {'x': csv_nbit, 'y': area}])
+        area = _quad(nbit, area, csv_nbit)
         return area
 
     def bitwise_estimate_area(self, interface):
-        this_dir, this_filename = os.path.split(__file__)
-        csv_file_path = os.path.join(this_dir, 'data/bitwise.csv')
+        csv_file_path = _CSV_PATHS['bitwise']
         csv_area = AladdinAreaQueires.query_csv_area_using_latency(interface, csv_file_path)
         return csv_area
-
-# # helper function (if your accelergy version is < 0.2 use this function directly instead of import)
-# def oneD_quadratic_interpolation(desired_x, known):
-#     """
-#     utility function that performs 1D linear interpolation with a known energy value
-#     :param desired_x: integer value of the desired attribute/argument
-#     :param known: list of dictionary [{x: <value>, y: <energy>}]
-#
-#     :return energy value with desired attribute/argument
-#
-#     """
-#     # assume E = ax^2 + c where x is a hardware attribute
-#     ordered_list = []
-#     if known[1]['x'] < known[0]['x']:
-#         ordered_list.append(known[1])
-#         ordered_list.append(known[0])
-#     else:
-#         ordered_list = known
-#
-#     slope = (known[1]['y'] - known[0]['y']) / (known[1]['x']**2 - known[0]['x']**2)
-#     desired_energy = slope * (desired_x**2 - ordered_list[0]['x']**2) + ordered_list[0]['y']
-#     return desired_energy